@@ -13,27 +13,48 @@ import sys
 import re
 
 # Basic secret patterns - production library has 12+ types
+# Each entry is (literal prefix every match starts with, pattern)
 SECRET_PATTERNS = {
-    'OPENAI_API_KEY': r'sk-[a-zA-Z0-9]{40,}',
-    'ANTHROPIC_API_KEY': r'sk-ant-[a-zA-Z0-9_-]{95,}',
-    'AWS_ACCESS_KEY': r'AKIA[0-9A-Z]{16}',
+    'OPENAI_API_KEY': ('sk-', r'sk-[a-zA-Z0-9]{40,}'),
+    'ANTHROPIC_API_KEY': ('sk-ant-', r'sk-ant-[a-zA-Z0-9_-]{95,}'),
+    'AWS_ACCESS_KEY': ('AKIA', r'AKIA[0-9A-Z]{16}'),
 }
 
+# The prefilter is only sound if each pattern really begins with its prefix
+for _secret_type, (_prefix, _pattern) in SECRET_PATTERNS.items():
+    assert _pattern.startswith(_prefix), f"{_secret_type} pattern must start with {_prefix!r}"
+
+# One alternation with a named group per secret type, so the input is scanned
+# once. All three formats are case-fixed (AWS key IDs are uppercase-only), so
+# no re.IGNORECASE is needed.
+COMBINED_PATTERN = re.compile('|'.join(
+    f'(?P<{secret_type}>{pattern})'
+    for secret_type, (_, pattern) in SECRET_PATTERNS.items()
+))
+
+# Input without any pattern's prefix skips the regex scan entirely
+SECRET_PREFIXES = tuple(dict.fromkeys(prefix for prefix, _ in SECRET_PATTERNS.values()))
+
+# One match is enough to block; anything past this only lengthens stderr
+MAX_REPORTED = 16
+
 def detect_secrets(text):
     """Detect secrets in text content"""
     secrets_found = []
-    for secret_type, pattern in SECRET_PATTERNS.items():
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            secrets_found.append((match.group(), secret_type))
+    if not any(prefix in text for prefix in SECRET_PREFIXES):
+        return secrets_found
+    for match in COMBINED_PATTERN.finditer(text):
+        secrets_found.append((match.group(), match.lastgroup))
+        if len(secrets_found) >= MAX_REPORTED:
+            break
     return secrets_found
 
 def main():
     """Main hook entry point"""
     try:
-        # Read tool call from stdin
-        input_data = sys.stdin.read().strip()
-        if not input_data:
+        # Read tool call from stdin as raw bytes; json.loads decodes them itself
+        input_data = sys.stdin.buffer.read()
+        if not input_data.strip():
             sys.exit(0)
         
         tool_call = json.loads(input_data)
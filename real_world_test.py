@@ -4,7 +4,9 @@ Real-World Integration Test
 Tests the verification system with actual scenarios Claude Code might encounter
 """
 
+import asyncio
 import json
+import os
 import subprocess
 import sys
 import tempfile
@@ -76,14 +78,18 @@ def test_scenario_2_verified_claim_with_safe_content():
         }
     }
     
+    # Both hooks see the same input independently, so run them side by side
+    zt_result, cv_result = run_hooks_concurrently([
+        ("examples/hooks/zero_trust_security/hook.py", tool_call),
+        ("response_claim_validator_hook.py", tool_call)
+    ])
+    
     # Should pass through zero trust (no secrets)
-    zt_result = run_hook("examples/hooks/zero_trust_security/hook.py", tool_call)
     if zt_result["exit_code"] != 0:
         print("❌ Zero trust hook failed unexpectedly")
         return False
     
     # Should pass through claim validation (verified claim)
-    cv_result = run_hook("response_claim_validator_hook.py", tool_call)
     if cv_result["exit_code"] != 0:
         print("❌ Claim validation failed for verified claim")
         return False
@@ -104,8 +110,10 @@ def test_scenario_3_performance_under_load():
     
     # Test claim validation performance
     start = time.time()
-    for call in test_calls:
-        result = run_hook("response_claim_validator_hook.py", call)
+    results = run_hooks_concurrently(
+        [("response_claim_validator_hook.py", call) for call in test_calls]
+    )
+    for call, result in zip(test_calls, results):
         if result["exit_code"] != 0:
             print(f"❌ Performance test failed on call {call}")
             return False
@@ -114,8 +122,10 @@ def test_scenario_3_performance_under_load():
     
     # Test zero trust performance  
     start = time.time()
-    for call in test_calls:
-        result = run_hook("examples/hooks/zero_trust_security/hook.py", call)
+    results = run_hooks_concurrently(
+        [("examples/hooks/zero_trust_security/hook.py", call) for call in test_calls]
+    )
+    for call, result in zip(test_calls, results):
         if result["exit_code"] != 0:
             print(f"❌ Performance test failed on call {call}")
             return False
@@ -166,32 +176,93 @@ def test_scenario_4_edge_cases():
     print("✅ Scenario 4 passed: Edge cases handled correctly")
     return True
 
+def test_scenario_5_overlapping_claims():
+    """Test: Claims whose pattern matches overlap are each checked on their own"""
+    print("\n📋 Scenario 5: Overlapping claims")
+    
+    # "results show that" and "many servers exist" match different patterns
+    # over overlapping spans; the verified "Python" context must not hide the
+    # unverified "many servers" one
+    overlapping_call = {
+        "tool_name": "Bash",
+        "tool_input": {
+            "command": "Python is a programming language, and results show that "
+                       "many servers exist for it in production today."
+        }
+    }
+    verified_call = {
+        "tool_name": "Bash",
+        "tool_input": {"command": "echo 'Python is a programming language'"}
+    }
+    
+    hooks = [
+        "response_claim_validator_hook.py",
+        "claude-code-provenance-verification/src/hooks/response_claim_validator_hook.py"
+    ]
+    invocations = [(hook, call) for hook in hooks for call in (overlapping_call, verified_call)]
+    results = run_hooks_concurrently(invocations)
+    
+    for (hook, call), result in zip(invocations, results):
+        expected = 2 if call is overlapping_call else 0
+        if result["exit_code"] != expected:
+            print(f"❌ {hook} returned {result['exit_code']}, expected {expected}")
+            return False
+    
+    print("✅ Scenario 5 passed: Overlapping claims validated independently")
+    return True
+
 def run_hook(hook_path: str, input_data: dict) -> dict:
     """Run a hook with input data and return results"""
+    return asyncio.run(run_hook_async(hook_path, input_data))
+
+async def run_hook_async(hook_path: str, input_data: dict) -> dict:
+    """Run a hook with input data without blocking the event loop"""
     try:
-        json_input = json.dumps(input_data)
-        
-        process = subprocess.run(
-            [sys.executable, hook_path],
-            input=json_input,
-            capture_output=True,
-            text=True,
-            timeout=5
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, hook_path,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
         
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(json.dumps(input_data).encode()),
+                timeout=5
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        
         return {
             "exit_code": process.returncode,
-            "stdout": process.stdout,
-            "stderr": process.stderr
+            "stdout": stdout.decode(),
+            "stderr": stderr.decode()
         }
         
     except Exception as e:
         return {
             "exit_code": -1,
             "stdout": "",
-            "stderr": str(e)
+            "stderr": str(e) or type(e).__name__
         }
 
+def run_hooks_concurrently(invocations: list) -> list:
+    """Run (hook_path, input_data) pairs concurrently, at most one process per CPU at a time"""
+    async def run_all():
+        limit = asyncio.Semaphore(os.cpu_count() or 1)
+        
+        async def run_one(hook_path, input_data):
+            async with limit:
+                return await run_hook_async(hook_path, input_data)
+        
+        return await asyncio.gather(
+            *(run_one(hook_path, data) for hook_path, data in invocations)
+        )
+    
+    return asyncio.run(run_all())
+
 def main():
     """Run all real-world test scenarios"""
     print("🌍 Real-World Integration Testing")
@@ -201,7 +272,8 @@ def main():
         test_scenario_1_secret_detection_with_claims,
         test_scenario_2_verified_claim_with_safe_content, 
         test_scenario_3_performance_under_load,
-        test_scenario_4_edge_cases
+        test_scenario_4_edge_cases,
+        test_scenario_5_overlapping_claims
     ]
     
     passed = 0
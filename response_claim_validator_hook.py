@@ -7,8 +7,7 @@ Intercepts tool calls and validates claims before execution
 import sys
 import json
 import re
-import subprocess
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
 
 # Patterns that indicate potential unverified claims
 CLAIM_PATTERNS = [
@@ -21,20 +20,22 @@ CLAIM_PATTERNS = [
     r'\b(?:extensive|comprehensive|numerous)\b.*\b(?:infrastructure|systems?|servers?)\b'
 ]
 
+# Compiled once at import rather than looked up in the re cache on every call.
+# Kept as separate patterns: their greedy .* spans overlap, and a single
+# alternation would let one match swallow claims the others must still see.
+COMPILED_CLAIM_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in CLAIM_PATTERNS]
+
 def contains_potential_claim(text: str) -> List[str]:
     """Check if text contains patterns that suggest unverified claims"""
     found_claims = []
-    text_lower = text.lower()
     
-    for pattern in CLAIM_PATTERNS:
-        matches = re.findall(pattern, text_lower, re.IGNORECASE)
-        if matches:
-            # Extract the broader context around the match
-            for match in re.finditer(pattern, text_lower, re.IGNORECASE):
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end].strip()
-                found_claims.append(context)
+    for pattern in COMPILED_CLAIM_PATTERNS:
+        # Extract the broader context around each match
+        for match in pattern.finditer(text):
+            start = max(0, match.start() - 50)
+            end = min(len(text), match.end() + 50)
+            context = text[start:end].strip()
+            found_claims.append(context)
     
     return found_claims
 
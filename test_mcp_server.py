@@ -40,28 +40,68 @@ def handle_initialize(params):
         }
     }
 
+def is_incomplete(error, buffer):
+    """Check whether a decode error only means the message hasn't fully arrived"""
+    return error.pos >= len(buffer.rstrip())
+
+def drain(decoder, buffer, at_eof=False):
+    """Decode every complete message in buffer, returning them and the remainder"""
+    requests = []
+    
+    while True:
+        buffer = buffer.lstrip()
+        if not buffer:
+            break
+        
+        try:
+            request, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError as e:
+            if is_incomplete(e, buffer) and not at_eof:
+                break  # Wait for the rest of the message
+            # Malformed, or cut off by EOF: drop the first line and retry, so a
+            # stray fragment can't hold the frames after it hostage
+            print(f"[TEST-MCP] JSON decode error: {e}", file=sys.stderr)
+            buffer = buffer.partition("\n")[2]
+            continue
+        
+        buffer = buffer[end:]
+        requests.append(request)
+    
+    return requests, buffer
+
+def handle_request(request):
+    """Answer a request; returns True once the server should exit"""
+    print(f"[TEST-MCP] Received: {request}", file=sys.stderr)
+    
+    if request.get("method") == "initialize":
+        response = handle_initialize(request.get("params", {}))
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+        
+        # Exit after first initialize to make testing simple
+        print("[TEST-MCP] Initialize complete, exiting", file=sys.stderr)
+        return True
+    
+    return False
+
 def main():
     """Simple MCP server for testing"""
     print("[TEST-MCP] Test MCP server started", file=sys.stderr)
     
+    # Accumulate lines so frames that span several lines decode. A pending
+    # partial frame is re-decoded from its start as each new line arrives.
+    decoder = json.JSONDecoder()
+    buffer = ""
+    
     try:
         for line in sys.stdin:
-            try:
-                request = json.loads(line.strip())
-                print(f"[TEST-MCP] Received: {request}", file=sys.stderr)
-                
-                if request.get("method") == "initialize":
-                    response = handle_initialize(request.get("params", {}))
-                    print(json.dumps(response))
-                    sys.stdout.flush()
-                    
-                    # Exit after first initialize to make testing simple
-                    print("[TEST-MCP] Initialize complete, exiting", file=sys.stderr)
-                    break
-                    
-            except json.JSONDecodeError as e:
-                print(f"[TEST-MCP] JSON decode error: {e}", file=sys.stderr)
-                continue
+            requests, buffer = drain(decoder, buffer + line)
+            if any(handle_request(request) for request in requests):
+                return
+        
+        # Input ended; salvage whatever complete frames follow a partial one
+        requests, buffer = drain(decoder, buffer, at_eof=True)
+        any(handle_request(request) for request in requests)
                 
     except KeyboardInterrupt:
         print("[TEST-MCP] Shutting down", file=sys.stderr)